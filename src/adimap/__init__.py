@@ -2,6 +2,8 @@
 
 __all__ = [
     "parse_adif",
+    "read_adif",
     "maidenhead_to_latlon",
+    "maidenhead_batch_to_latlon",
     "build_map",
 ]
@@ -2,32 +2,62 @@ from __future__ import annotations
 
 import re
 
+_EOH_RE = re.compile(r"<eoh>", re.IGNORECASE)
 _EOR_RE = re.compile(r"<eor>", re.IGNORECASE)
+_FIELD_RE = re.compile(r"<([A-Za-z0-9_]+):(\d+)(?::[^>]*)?>([^<]*)", re.DOTALL)
+# Tag header (text between "<" and ">") and a type that runs past the next "<"
+_HEAD_RE = re.compile(r"([A-Za-z0-9_]+):(\d+)(?::[^>]*)?")
+_OPEN_TYPE_RE = re.compile(r"[A-Za-z0-9_]+:\d+:")
 
 
 def parse_adif(content: str) -> list[dict[str, str]]:
-    """Parse ADIF content into a list of dicts (field names uppercased)."""
+    """Parse ADIF content into a list of dicts (field names uppercased).
+
+    Each record is split on ``<`` and every piece's tag header is looked up
+    in a per-call cache, so only distinct headers hit the regex. A stray
+    ``<`` in a value just yields a piece that is not a tag. Records with a
+    ``<`` inside a tag's type are rare and go through ``_FIELD_RE``.
+    """
     records: list[dict[str, str]] = []
+    heads: dict[str, tuple[str, int] | bool] = {}
 
-    header_end = re.search(r"<eoh>", content, flags=re.IGNORECASE)
+    header_end = _EOH_RE.search(content)
     data = content[header_end.end() :] if header_end else content
 
-    raw_recs = re.split(_EOR_RE, data)
-    field_pat = re.compile(r"<([A-Za-z0-9_]+):(\d+)(?::[^>]*)?>([^<]*)", re.DOTALL)
-
-    for raw in raw_recs:
-        raw = raw.strip()
-        if not raw:
-            continue
-
-        entry: dict[str, str] = {}
-        for match in field_pat.finditer(raw):
-            name = match.group(1).upper()
-            length = int(match.group(2))
-            value = match.group(3)[:length]
-            entry[name] = value.strip()
+    for raw in _EOR_RE.split(data):
+        entry: dict[str, str] | None = {}
+        for chunk in raw.split("<")[1:]:
+            head, sep, value = chunk.partition(">")
+            if not sep:
+                if _OPEN_TYPE_RE.match(chunk):
+                    entry = None
+                    break
+                continue
+
+            tag = heads.get(head)
+            if tag is None:
+                m = _HEAD_RE.fullmatch(head)
+                tag = heads[head] = (m[1].upper(), int(m[2])) if m else False
+            if tag:
+                entry[tag[0]] = value[: tag[1]].strip()
+
+        if entry is None:
+            entry = {}
+            for m in _FIELD_RE.finditer(raw):
+                entry[m[1].upper()] = m[3][: int(m[2])].strip()
 
         if entry:
             records.append(entry)
 
     return records
+
+
+def read_adif(path: str) -> list[dict[str, str]]:
+    """Read and parse an ADIF file (UTF-8, undecodable bytes dropped).
+
+    The file is read as bytes and decoded once, which skips the text I/O
+    layer; field lengths count characters of the decoded text.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    return parse_adif(data.decode("utf-8", errors="ignore"))
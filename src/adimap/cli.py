@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import argparse
 
-from .adif import parse_adif
+from .adif import read_adif
 from .maidenhead import maidenhead_to_latlon
-from .map_builder import build_map
+from .map_builder import FAST_THRESHOLD, build_map
 
 
 def _build_args() -> argparse.Namespace:
@@ -87,16 +87,25 @@ def _build_args() -> argparse.Namespace:
         help="Add a TimestampedGeoJson time slider based on QSO date/time",
     )
 
+    # Rendering
+    parser.add_argument(
+        "--fast-threshold",
+        type=int,
+        default=FAST_THRESHOLD,
+        help=(
+            "Write a plain Leaflet page instead of using Folium when at least "
+            f"this many QSOs are plotted (default: {FAST_THRESHOLD}; 0 = never). "
+            "Not used with --time-slider or per-band/mode heatmaps."
+        ),
+    )
+
     return parser.parse_args()
 
 
 def main() -> None:
     args = _build_args()
 
-    with open(args.adi, encoding="utf-8", errors="ignore") as f:
-        content = f.read()
-
-    records = parse_adif(content)
+    records = read_adif(args.adi)
 
     home_latlon: tuple[float, float] | None = None
     if args.home_grid:
@@ -123,4 +132,5 @@ def main() -> None:
         export_csv=args.export_csv,
         export_geojson=args.export_geojson,
         time_slider=args.time_slider,
+        fast_threshold=args.fast_threshold,
     )
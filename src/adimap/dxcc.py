@@ -81,6 +81,13 @@ PREFIX_COUNTRY: dict[str, str] = {
 }
 
 
+# Distinct prefix lengths, longest first, so lookups probe the dict
+# instead of scanning every prefix.
+_PREFIX_LENGTHS: tuple[int, ...] = tuple(
+    sorted({len(p) for p in PREFIX_COUNTRY}, reverse=True)
+)
+
+
 def lookup_country(callsign: str | None) -> str | None:
     """Best-effort callsign → country lookup using prefix heuristics.
 
@@ -89,8 +96,8 @@ def lookup_country(callsign: str | None) -> str | None:
     if not callsign:
         return None
     cs = callsign.strip().upper()
-    best = None
-    for pref, name in PREFIX_COUNTRY.items():
-        if cs.startswith(pref) and (best is None or len(pref) > len(best[0])):
-            best = (pref, name)
-    return best[1] if best else None
+    for n in _PREFIX_LENGTHS:
+        name = PREFIX_COUNTRY.get(cs[:n])
+        if name:
+            return name
+    return None
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def json_bytes(obj: object) -> bytes:
+    """Compact UTF-8 JSON via orjson when installed, else the json module.
+
+    Both parse back to the same value, but number formatting may differ
+    (orjson writes ``0.00001`` where json writes ``1e-05``).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import html
+from collections.abc import Sequence
+from string import Template
+
+from .jsonutil import json_bytes
+
+# Same Leaflet / plugin builds Folium loads, so both renderers look alike.
+_CSS = (
+    "https://cdn.jsdelivr.net/npm/leaflet@1.9.3/dist/leaflet.css",
+    "https://netdna.bootstrapcdn.com/bootstrap/3.0.0/css/bootstrap-glyphicons.css",
+    "https://cdnjs.cloudflare.com/ajax/libs/Leaflet.awesome-markers/2.0.2/leaflet.awesome-markers.css",
+    "https://cdnjs.cloudflare.com/ajax/libs/leaflet.markercluster/1.1.0/MarkerCluster.css",
+    "https://cdnjs.cloudflare.com/ajax/libs/leaflet.markercluster/1.1.0/MarkerCluster.Default.css",
+)
+_JS = (
+    "https://cdn.jsdelivr.net/npm/leaflet@1.9.3/dist/leaflet.js",
+    "https://cdnjs.cloudflare.com/ajax/libs/Leaflet.awesome-markers/2.0.2/leaflet.awesome-markers.js",
+    "https://cdnjs.cloudflare.com/ajax/libs/leaflet.markercluster/1.1.0/leaflet.markercluster.js",
+    "https://cdn.jsdelivr.net/gh/python-visualization/folium@main/folium/templates/leaflet_heat.min.js",
+)
+
+BASEMAPS = (
+    (
+        "OpenStreetMap",
+        "https://tile.openstreetmap.org/{z}/{x}/{y}.png",
+        "© OpenStreetMap contributors",
+    ),
+    (
+        "CartoDB Positron",
+        "https://{s}.basemaps.cartocdn.com/light_all/{z}/{x}/{y}{r}.png",
+        "© OpenStreetMap contributors, © CARTO",
+    ),
+    (
+        "CartoDB Dark Matter",
+        "https://{s}.basemaps.cartocdn.com/dark_all/{z}/{x}/{y}{r}.png",
+        "© OpenStreetMap contributors, © CARTO",
+    ),
+)
+
+_PAGE = Template(
+    """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>$title</title>
+$css
+$js
+<style>html, body, #map { width: 100%; height: 100%; margin: 0; padding: 0; }</style>
+</head>
+<body>
+<div id="map"></div>
+$overlays
+<script>
+const OPTS = $opts;
+const QSOS = $qsos;
+
+const map = L.map("map", {
+  center: OPTS.center, zoom: 2, zoomControl: true, preferCanvas: true
+});
+L.control.scale().addTo(map);
+
+const bases = {};
+OPTS.basemaps.forEach(function (b, i) {
+  const layer = L.tileLayer(b[1], { attribution: b[2], maxZoom: 19 });
+  bases[b[0]] = layer;
+  if (i === 0) layer.addTo(map);
+});
+
+const overlays = {};
+const layers = OPTS.groups.map(function (name) {
+  const layer = OPTS.cluster
+    ? L.markerClusterGroup({ chunkedLoading: true })
+    : L.featureGroup();
+  layer.addTo(map);
+  overlays[name] = layer;
+  return layer;
+});
+
+const icons = OPTS.colors.map(function (c) {
+  return L.AwesomeMarkers.icon({
+    icon: "signal", iconColor: "white", markerColor: c, prefix: "glyphicon"
+  });
+});
+
+const perGroup = OPTS.groups.map(function () { return []; });
+for (let i = 0; i < QSOS.lat.length; i++) {
+  perGroup[QSOS.group[i]].push(
+    L.marker([QSOS.lat[i], QSOS.lon[i]], { icon: icons[QSOS.color[i]] })
+      .bindPopup(QSOS.popup[i], { maxWidth: 350 })
+      .bindTooltip(QSOS.tooltip[i])
+  );
+}
+perGroup.forEach(function (markers, g) {
+  if (OPTS.cluster) {
+    layers[g].addLayers(markers);
+  } else {
+    markers.forEach(function (m) { layers[g].addLayer(m); });
+  }
+});
+
+const latlngs = QSOS.lat.map(function (lat, i) { return [lat, QSOS.lon[i]]; });
+if (OPTS.connect && latlngs.length >= 2) {
+  L.polyline(latlngs, { weight: 2, opacity: 0.7 }).addTo(map);
+}
+if (OPTS.heatmap && latlngs.length) {
+  overlays["Heatmap (All)"] = L.heatLayer(latlngs, {
+    radius: 15, blur: 25, minOpacity: 0.2
+  }).addTo(map);
+}
+if (OPTS.home) {
+  L.marker(OPTS.home, {
+    icon: L.AwesomeMarkers.icon({
+      icon: "home", iconColor: "white", markerColor: "red", prefix: "glyphicon"
+    })
+  }).bindTooltip("Home QTH").bindPopup("Home QTH").addTo(map);
+}
+if (OPTS.bounds) {
+  map.fitBounds(OPTS.bounds, { padding: [25, 25] });
+}
+
+L.control.layers(bases, overlays, { collapsed: false }).addTo(map);
+</script>
+</body>
+</html>
+"""
+)
+
+
+def _script_json(obj: object) -> str:
+    # "</" would end the inline <script> early (popups carry </b>, </a>).
+    return json_bytes(obj).decode().replace("</", "<\\/")
+
+
+def save_leaflet_html(
+    out_path: str,
+    *,
+    title: str,
+    center: tuple[float, float],
+    bounds: Sequence[tuple[float, float]] | None,
+    lats: Sequence[float],
+    lons: Sequence[float],
+    color_idx: Sequence[int],
+    group_idx: Sequence[int],
+    popups: Sequence[str],
+    tooltips: Sequence[str],
+    colors: Sequence[str],
+    groups: Sequence[str],
+    cluster: bool = True,
+    heatmap: bool = False,
+    connect: bool = False,
+    home_latlon: tuple[float, float] | None = None,
+    overlays_html: str = "",
+) -> None:
+    """Write a standalone Leaflet page without building Folium objects.
+
+    QSOs are passed as parallel columns and serialized in one JSON call
+    (orjson when installed); the page's script creates the markers
+    client-side. ``color_idx`` and ``group_idx`` index into ``colors``
+    (marker colors) and ``groups`` (overlay layer names).
+    """
+    opts = {
+        "center": list(center),
+        "bounds": [list(p) for p in bounds] if bounds else None,
+        "colors": list(colors),
+        "groups": list(groups),
+        "cluster": cluster,
+        "heatmap": heatmap,
+        "connect": connect,
+        "home": list(home_latlon) if home_latlon else None,
+        "basemaps": BASEMAPS,
+    }
+    qsos = {
+        "lat": list(lats),
+        "lon": list(lons),
+        "color": list(color_idx),
+        "group": list(group_idx),
+        "popup": list(popups),
+        "tooltip": list(tooltips),
+    }
+    page = _PAGE.substitute(
+        title=html.escape(title),
+        css="\n".join(f'<link rel="stylesheet" href="{u}">' for u in _CSS),
+        js="\n".join(f'<script src="{u}"></script>' for u in _JS),
+        overlays=overlays_html,
+        opts=_script_json(opts),
+        qsos=_script_json(qsos),
+    )
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write(page)
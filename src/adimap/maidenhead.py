@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+
+import numpy as np
+
 
 def maidenhead_to_latlon(grid: str) -> tuple[float, float] | None:
     """Convert Maidenhead grid (e.g. FN20, JN58TD) → (lat, lon) cell center.
@@ -50,3 +54,84 @@ def maidenhead_to_latlon(grid: str) -> tuple[float, float] | None:
         cell_lat = 1.0 / 240.0
 
     return (lat + cell_lat / 2.0, lon + cell_lon / 2.0)
+
+
+def maidenhead_batch_to_latlon(
+    grids: Sequence[str | None],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized :func:`maidenhead_to_latlon` over many grids.
+
+    Returns ``(lat, lon)`` float64 arrays; rows that do not parse are NaN.
+    Well-formed 2/4/6/8-char grids are converted in bulk with NumPy on
+    their code points; any other non-empty row falls back to the scalar
+    converter.
+    """
+    n = len(grids)
+    lat = np.full(n, np.nan)
+    lon = np.full(n, np.nan)
+    if n == 0:
+        return lat, lon
+
+    texts = [g or "" for g in grids]
+    raw_lens = np.fromiter(map(len, texts), dtype=np.int64, count=n)
+    # Only rows that fit 8 chars after stripping go into the fixed-width
+    # array, so one junk value cannot widen it; longer ones use the scalar
+    # converter.
+    too_long = np.zeros(n, dtype=bool)
+    for i in np.flatnonzero(raw_lens > 8).tolist():
+        t = texts[i].strip()
+        if len(t) > 8:
+            t = ""
+            too_long[i] = True
+        texts[i] = t
+        raw_lens[i] = len(t)
+
+    packed = np.array(texts, dtype="U8")
+    # NumPy treats NUL as padding (and strip() then exposes more of it), so
+    # rows holding one go to the scalar converter.
+    cps = packed.view(np.uint32).reshape(n, 8)
+    nul = ((cps == 0) & (np.arange(8) < raw_lens[:, None])).any(axis=1)
+    norm = np.char.upper(np.char.strip(packed))
+    lens = np.char.str_len(norm)
+    # Code points of the (at most 8) chars of each row
+    b = norm.astype("U8").view(np.uint32).reshape(n, 8).astype(np.float64)
+
+    def _alpha(col: int) -> np.ndarray:
+        return (b[:, col] >= 65) & (b[:, col] <= 90)
+
+    def _digit(col: int) -> np.ndarray:
+        return (b[:, col] >= 48) & (b[:, col] <= 57)
+
+    l4 = lens >= 4
+    l6 = lens >= 6
+    l8 = lens >= 8
+    ok = ((lens == 2) | (lens == 4) | (lens == 6) | (lens == 8)) & _alpha(0)
+    ok &= _alpha(1)
+    ok &= ~l4 | (_digit(2) & _digit(3))
+    ok &= ~l6 | (_alpha(4) & _alpha(5))
+    ok &= ~l8 | (_digit(6) & _digit(7))
+    ok &= ~nul
+    fallback = (~ok & (lens > 0)) | nul | too_long
+
+    # Same accumulation order as the scalar version, so results match.
+    blon = (b[:, 0] - 65) * 20 - 180
+    blat = (b[:, 1] - 65) * 10 - 90
+    blon += np.where(l4, (b[:, 2] - 48) * 2, 0.0)
+    blat += np.where(l4, (b[:, 3] - 48) * 1, 0.0)
+    blon += np.where(l6, (b[:, 4] - 65) * (2 / 24), 0.0)
+    blat += np.where(l6, (b[:, 5] - 65) * (1 / 24), 0.0)
+    blon += np.where(l8, (b[:, 6] - 48) * (2 / 240), 0.0)
+    blat += np.where(l8, (b[:, 7] - 48) * (1 / 240), 0.0)
+
+    cell_lon = np.select([l8, l6, l4], [2.0 / 240.0, 2.0 / 24.0, 2.0], 20.0)
+    cell_lat = np.select([l8, l6, l4], [1.0 / 240.0, 1.0 / 24.0, 1.0], 10.0)
+
+    lat[ok] = (blat + cell_lat / 2.0)[ok]
+    lon[ok] = (blon + cell_lon / 2.0)[ok]
+
+    for i in np.flatnonzero(fallback).tolist():
+        pair = maidenhead_to_latlon(grids[i])
+        if pair:
+            lat[i], lon[i] = pair
+
+    return lat, lon
@@ -4,19 +4,97 @@
 from __future__ import annotations
 
 import csv
-import json
-from collections.abc import Iterable
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Sequence
 from datetime import datetime
 from textwrap import dedent
 
 import folium
-from folium.plugins import HeatMap, MarkerCluster, TimestampedGeoJson
+import numpy as np
+from folium.plugins import FastMarkerCluster, HeatMap, TimestampedGeoJson
 
-from .maidenhead import maidenhead_to_latlon
+from .jsonutil import json_bytes
+from .leaflet_html import save_leaflet_html
+from .maidenhead import maidenhead_batch_to_latlon, maidenhead_to_latlon
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
 
 # -------------------------- Parsing helpers ---------------------------
 
 
+# Exact powers of ten: mantissa / 10**k is then correctly rounded.
+_POW10 = np.array([10.0**k for k in range(23)])
+
+
+def _parse_coord_u8(buf: np.ndarray, n: int) -> float:
+    """Parse ``[+-]digits[.digits][NESW]`` from ASCII bytes.
+
+    Returns ``nan`` for anything outside that shape (exponents, ``inf``,
+    underscores, unknown suffixes, too many digits) so the caller can fall
+    back to :func:`float`. Compiled with Numba when it is installed.
+    """
+    end = n
+    neg = False
+    last = buf[n - 1] | 0x20  # ASCII lowercase
+    if last == 110 or last == 101:  # n, e
+        end -= 1
+    elif last == 115 or last == 119:  # s, w
+        end -= 1
+        neg = True
+
+    i = 0
+    if i < end and (buf[i] == 43 or buf[i] == 45):  # +, -
+        if buf[i] == 45:
+            neg = not neg
+        i += 1
+
+    mant = 0
+    digits = 0
+    frac = 0
+    seen_dot = False
+    while i < end:
+        c = buf[i]
+        if 48 <= c <= 57:
+            mant = mant * 10 + (int(c) - 48)
+            digits += 1
+            if seen_dot:
+                frac += 1
+        elif c == 46 and not seen_dot:  # .
+            seen_dot = True
+        else:
+            return np.nan
+        i += 1
+
+    if digits == 0 or digits > 15 or frac > 22:
+        return np.nan
+
+    val = mant / _POW10[frac]
+    return -val if neg else val
+
+
+def _parse_coords_u8(rows: np.ndarray, lens: np.ndarray) -> np.ndarray:
+    out = np.empty(rows.shape[0])
+    for i in range(rows.shape[0]):
+        out[i] = _parse_coord_u8(rows[i], lens[i]) if lens[i] else np.nan
+    return out
+
+
+if njit is not None:
+    _parse_coord_u8 = njit("float64(uint8[:], int64)", cache=True)(_parse_coord_u8)
+    _parse_coords_jit = njit("float64[:](uint8[:, :], int64[:])", cache=True)(
+        _parse_coords_u8
+    )
+else:
+    _parse_coords_jit = None
+
+
+_HEMI_SIGN = dict.fromkeys("NEne", 1.0) | dict.fromkeys("SWsw", -1.0)
+
+
 def _parse_coord(text: str, is_lat: bool) -> float | None:
     if text is None:
         return None
@@ -25,22 +103,14 @@ def _parse_coord(text: str, is_lat: bool) -> float | None:
     if not s:
         return None
 
-    suffix = s[-1].upper() if s[-1].isalpha() else ""
-    val_str = s[:-1] if suffix else s
-
+    # One lookup for the hemisphere suffix; any other trailing letter makes
+    # float() fail, as it should.
+    sign = _HEMI_SIGN.get(s[-1])
     try:
-        val = float(val_str)
+        val = float(s) if sign is None else sign * float(s[:-1])
     except ValueError:
         return None
 
-    if suffix:
-        if suffix in ("N", "E"):
-            pass
-        elif suffix in ("S", "W"):
-            val = -val
-        else:
-            return None
-
     if is_lat and not (-90.0 <= val <= 90.0):
         return None
     if not is_lat and not (-180.0 <= val <= 180.0):
@@ -57,6 +127,37 @@ def parse_latlon(lat_str: str, lon_str: str) -> tuple[float, float] | None:
     return (lat, lon)
 
 
+def _parse_coord_batch(texts: list[str | None], is_lat: bool) -> np.ndarray:
+    """:func:`_parse_coord` over a column; ``nan`` where it returns None.
+
+    With Numba installed, short ASCII values are parsed by the compiled
+    kernel in one call and only its rejects go through :func:`float`.
+    """
+    out = np.full(len(texts), np.nan)
+    idx = [i for i, t in enumerate(texts) if t]
+    norm = [texts[i].strip() for i in idx]
+    todo: Iterable[int] = range(len(idx))
+
+    if _parse_coords_jit is not None and idx:
+        packed = np.array(
+            [t if len(t) <= 16 and t.isascii() and "\0" not in t else "" for t in norm],
+            dtype="S16",
+        )
+        rows = packed.view(np.uint8).reshape(len(idx), 16)
+        vals = _parse_coords_jit(rows, np.char.str_len(packed).astype(np.int64))
+        limit = 90.0 if is_lat else 180.0
+        vals[~(np.abs(vals) <= limit)] = np.nan
+        out[idx] = vals
+        todo = np.flatnonzero(np.isnan(vals)).tolist()
+
+    for j in todo:
+        if norm[j]:
+            val = _parse_coord(norm[j], is_lat)
+            if val is not None:
+                out[idx[j]] = val
+    return out
+
+
 def best_latlon(entry: dict[str, str]) -> tuple[float, float, str] | None:
     lat = entry.get("LAT")
     lon = entry.get("LON")
@@ -74,33 +175,86 @@ def best_latlon(entry: dict[str, str]) -> tuple[float, float, str] | None:
     return None
 
 
+def best_latlons(
+    records: list[dict[str, str]],
+) -> list[tuple[float, float, str] | None]:
+    """:func:`best_latlon` over many records, converting grids in bulk.
+
+    Only records without a usable LAT/LON get their grid converted.
+    """
+    lats = _parse_coord_batch([r.get("LAT") for r in records], True)
+    lons = _parse_coord_batch([r.get("LON") for r in records], False)
+    use_ll = ~(np.isnan(lats) | np.isnan(lons))
+
+    grid_lat = np.full(len(records), np.nan)
+    grid_lon = np.full(len(records), np.nan)
+    rest = np.flatnonzero(~use_ll)
+    if rest.size:
+        grid_lat[rest], grid_lon[rest] = maidenhead_batch_to_latlon(
+            [
+                records[i].get("GRIDSQUARE") or records[i].get("MY_GRIDSQUARE")
+                for i in rest.tolist()
+            ]
+        )
+
+    found = use_ll | ~np.isnan(grid_lat)
+    lat = np.where(use_ll, lats, grid_lat).tolist()
+    lon = np.where(use_ll, lons, grid_lon).tolist()
+    return [
+        (la, lo, "LATLON" if ll else "GRID") if ok else None
+        for la, lo, ll, ok in zip(
+            lat, lon, use_ll.tolist(), found.tolist(), strict=True
+        )
+    ]
+
+
+def _qso_iso(entry: dict[str, str]) -> str | None:
+    """``YYYY-MM-DDTHH:MM:SS`` from QSO_DATE/TIME_ON by slicing (unchecked)."""
+    d = (entry.get("QSO_DATE") or "").strip()
+    t = (entry.get("TIME_ON") or "").strip()
+    if len(d) != 8:
+        return None
+    hh = t[:2] if len(t) >= 2 else "00"
+    mm = t[2:4] if len(t) >= 4 else "00"
+    ss = t[4:6] if len(t) >= 6 else "00"
+    return f"{d[:4]}-{d[4:6]}-{d[6:8]}T{hh}:{mm}:{ss}"
+
+
+def _parse_qso_datetime(iso: str | None) -> datetime | None:
+    if iso is None:
+        return None
+    try:
+        return datetime.fromisoformat(iso)
+    except ValueError:
+        return None
+
+
 # -------------------------- UI + formatting ---------------------------
 
 
+_POPUP_KEYS = (
+    "CALL",
+    "QSO_DATE",
+    "TIME_ON",
+    "BAND",
+    "FREQ",
+    "MODE",
+    "RST_SENT",
+    "RST_RCVD",
+    "COUNTRY",
+    "GRIDSQUARE",
+    "LAT",
+    "LON",
+)
+
+
 def format_popup(entry: dict[str, str]) -> str:
     call = entry.get("CALL", "QSO")
     # external lookups
     qrz = f"https://www.qrz.com/lookup/{call}"
     clublog = f"https://clublog.org/logsearch/{call}"
 
-    fields = []
-    for key in (
-        "CALL",
-        "QSO_DATE",
-        "TIME_ON",
-        "BAND",
-        "FREQ",
-        "MODE",
-        "RST_SENT",
-        "RST_RCVD",
-        "COUNTRY",
-        "GRIDSQUARE",
-        "LAT",
-        "LON",
-    ):
-        value = entry.get(key)
-        if value:
-            fields.append(f"<b>{key}</b>: {value}")
+    fields = [f"<b>{k}</b>: {v}" for k in _POPUP_KEYS if (v := entry.get(k))]
 
     links = (
         f"<div style='margin-top:6px'>"
@@ -113,7 +267,24 @@ def format_popup(entry: dict[str, str]) -> str:
     return body
 
 
-def _title_element(title: str) -> folium.Element:
+# FastMarkerCluster callback: one row -> marker styled like folium.Icon /
+# folium.Popup, sharing one icon object per color.
+_MARKER_JS = """(function () {
+    var icons = {};
+    return function (row) {
+        var icon = icons[row[2]] || (icons[row[2]] = L.AwesomeMarkers.icon({
+            icon: "signal", iconColor: "white", markerColor: row[2],
+            prefix: "glyphicon"
+        }));
+        var marker = L.marker(new L.LatLng(row[0], row[1]), {icon: icon});
+        marker.bindPopup(row[3], {maxWidth: 350});
+        marker.bindTooltip(row[4]);
+        return marker;
+    };
+})()"""
+
+
+def _title_html(title: str) -> str:
     html = dedent(
         f"""
         <div style="position: fixed;
@@ -125,10 +296,10 @@ def _title_element(title: str) -> folium.Element:
         </div>
         """
     ).strip()
-    return folium.Element(html)
+    return html
 
 
-def _legend_element(items: list[tuple[str, str]], title: str) -> folium.Element:
+def _legend_html(items: list[tuple[str, str]], title: str) -> str:
     rows = []
     for label, color in sorted(items):
         rows.append(
@@ -149,45 +320,31 @@ def _legend_element(items: list[tuple[str, str]], title: str) -> folium.Element:
         </div>
         """
     ).strip()
-    return folium.Element(html)
+    return html
 
 
-def _stats_panel(entries: list[dict[str, str]]) -> folium.Element:
+def _stats_html(
+    entries: list[dict[str, str]],
+    bands: list[str],
+    modes: list[str],
+    datetimes: list[datetime | None],
+) -> str:
     total = len(entries)
     calls = {e.get("CALL", "") for e in entries if e.get("CALL")}
     dates: list[datetime] = []
 
-    def _parse_dt(e: dict[str, str]) -> datetime | None:
-        d = (e.get("QSO_DATE") or "").strip()
-        t = (e.get("TIME_ON") or "").strip()
-        if len(d) == 8:
-            y, m, day = d[:4], d[4:6], d[6:8]
-            hh = t[:2] if len(t) >= 2 else "00"
-            mm = t[2:4] if len(t) >= 4 else "00"
-            ss = t[4:6] if len(t) >= 6 else "00"
-            try:
-                return datetime.fromisoformat(f"{y}-{m}-{day}T{hh}:{mm}:{ss}")
-            except ValueError:
-                return None
-        return None
-
-    for e in entries:
-        dt = _parse_dt(e)
+    # counts by band / mode, collected in the same pass as the dates
+    by_band: Counter[str] = Counter()
+    by_mode: Counter[str] = Counter()
+    for b, m, dt in zip(bands, modes, datetimes, strict=True):
+        by_band[b or "OTHER"] += 1
+        by_mode[m or "OTHER"] += 1
         if dt:
             dates.append(dt)
 
     drange = f"{min(dates).date()} → {max(dates).date()}" if dates else "n/a"
 
-    # counts by band / mode
-    by_band: dict[str, int] = {}
-    by_mode: dict[str, int] = {}
-    for e in entries:
-        b = (e.get("BAND") or "").strip().upper() or "OTHER"
-        m = (e.get("MODE") or "").strip().upper() or "OTHER"
-        by_band[b] = by_band.get(b, 0) + 1
-        by_mode[m] = by_mode.get(m, 0) + 1
-
-    def _tab(d: dict[str, int]) -> str:
+    def _tab(d: Counter[str]) -> str:
         return "".join(
             f"<div style='display:flex;justify-content:space-between'><span>{k}</span><span>{v}</span></div>"
             for k, v in sorted(d.items())
@@ -210,47 +367,74 @@ def _stats_panel(entries: list[dict[str, str]]) -> folium.Element:
         </div>
         """
     ).strip()
-    return folium.Element(html)
+    return html
 
 
 # -------------------------- Colors & mapping --------------------------
 
-BAND_COLORS = {
-    "160M": "darkpurple",
-    "80M": "darkred",
-    "60M": "lightred",
-    "40M": "orange",
-    "30M": "beige",
-    "20M": "blue",
-    "17M": "lightblue",
-    "15M": "green",
-    "12M": "lightgreen",
-    "10M": "cadetblue",
-    "6M": "purple",
-    "4M": "pink",
-    "2M": "darkgreen",
-    "1.25M": "lightgray",
-    "70CM": "gray",
-    "33CM": "black",
-    "23CM": "darkblue",
-}
-
-MODE_COLORS = {
-    "SSB": "blue",
-    "CW": "darkred",
-    "FT8": "green",
-    "FT4": "purple",
-    "FM": "orange",
-    "RTTY": "darkpurple",
-    "AM": "gray",
-}
+
+class _ColorMap(dict):
+    """Color lookup that falls back to ``DEFAULT_COLOR`` for unknown keys."""
+
+    def __missing__(self, key: str) -> str:
+        return DEFAULT_COLOR
+
+
+BAND_COLORS = _ColorMap(
+    {
+        "160M": "darkpurple",
+        "80M": "darkred",
+        "60M": "lightred",
+        "40M": "orange",
+        "30M": "beige",
+        "20M": "blue",
+        "17M": "lightblue",
+        "15M": "green",
+        "12M": "lightgreen",
+        "10M": "cadetblue",
+        "6M": "purple",
+        "4M": "pink",
+        "2M": "darkgreen",
+        "1.25M": "lightgray",
+        "70CM": "gray",
+        "33CM": "black",
+        "23CM": "darkblue",
+    }
+)
+
+MODE_COLORS = _ColorMap(
+    {
+        "SSB": "blue",
+        "CW": "darkred",
+        "FT8": "green",
+        "FT4": "purple",
+        "FM": "orange",
+        "RTTY": "darkpurple",
+        "AM": "gray",
+    }
+)
 
 DEFAULT_COLOR = "gray"
 
+# Plotted QSO count from which build_map skips Folium (see its docstring)
+FAST_THRESHOLD = 5000
+
 
 # ---------------------------- Map builder ----------------------------
 
 
+def _indices_by(keys: list[str]) -> dict[str, array]:
+    """Row indices grouped by key (blank keys as ``OTHER``), first-seen order."""
+    groups: dict[str, array] = {}
+    for i, key in enumerate(keys):
+        key = key or "OTHER"
+        idx = groups.get(key)
+        if idx is None:
+            idx = groups[key] = array("i")
+        idx.append(i)
+    return groups
+
+
 def build_map(
     records: list[dict[str, str]],
     out_path: str,
@@ -266,6 +450,7 @@ def build_map(
     export_csv: str | None = None,
     export_geojson: str | None = None,
     time_slider: bool = False,
+    fast_threshold: int | None = FAST_THRESHOLD,
 ) -> None:
     """Create the Folium map with optional layers, heatmaps, exports & time.
 
@@ -276,28 +461,128 @@ def build_map(
       mode legend). For simplicity we avoid nested subgroups.
     * Use ``cluster=False`` to disable clustering on base-layer maps or inside
       band/mode layers.
+    * Logs with at least ``fast_threshold`` plotted QSOs are written as a
+      plain Leaflet page (see :mod:`adimap.leaflet_html`) instead of going
+      through Folium, unless the time slider or per-band/mode heatmaps are
+      requested. Pass ``None`` or ``0`` to always use Folium.
     """
-    points: list[tuple[float, float, dict[str, str]]] = []
+    # Plotted QSOs as parallel columns (structure of arrays).
+    lats = array("d")
+    lons = array("d")
+    recs: list[dict[str, str]] = []
+    bands: list[str] = []
+    modes: list[str] = []
+    datetimes: list[datetime | None] = []
+    stamps: list[str | None] = []  # ISO date/time where it parses
     skipped = 0
 
-    for rec in records:
-        pos = best_latlon(rec)
+    for rec, pos in zip(records, best_latlons(records), strict=True):
         if pos is None:
             skipped += 1
             continue
-        lat, lon, _src = pos
-        points.append((lat, lon, rec))
-
-    if not points and not home_latlon:
+        lats.append(pos[0])
+        lons.append(pos[1])
+        recs.append(rec)
+        bands.append((rec.get("BAND") or "").strip().upper())
+        modes.append((rec.get("MODE") or "").strip().upper())
+        iso = _qso_iso(rec)
+        dt = _parse_qso_datetime(iso)
+        datetimes.append(dt)
+        stamps.append(iso if dt else None)
+
+    coords = list(zip(lats, lons, strict=True))
+
+    if not recs and not home_latlon:
         raise SystemExit("No plottable QSO locations found (no LAT/LON or GRIDSQUARE).")
 
     # Center
     if home_latlon:
         center = home_latlon
     else:
-        avg_lat = sum(p[0] for p in points) / len(points)
-        avg_lon = sum(p[1] for p in points) / len(points)
-        center = (avg_lat, avg_lon)
+        center = (sum(lats) / len(lats), sum(lons) / len(lons))
+
+    # Decide grouping mode
+    use_band_layers = bool(layers_by_band)
+    use_mode_layers = bool(layers_by_mode and not layers_by_band)
+
+    # Colors, looked up once per QSO. With band layers we color by mode for
+    # extra info; with mode layers by mode; otherwise by band.
+    band_colors = [BAND_COLORS[b] for b in bands]
+    mode_colors = [MODE_COLORS[m] for m in modes]
+    colors = mode_colors if use_band_layers or use_mode_layers else band_colors
+
+    # Popup HTML, built once and shared with the time slider
+    popups = [format_popup(rec) for rec in recs]
+    tooltips = [rec.get("CALL", "QSO") for rec in recs]
+
+    # Legend (distinct (label, color) pairs, first-seen order) and stats
+    if use_band_layers or use_mode_layers:
+        legend_pairs = dict.fromkeys(
+            (m, c) for m, c in zip(modes, mode_colors, strict=True) if m
+        )
+        legend = _legend_html(list(legend_pairs), "Modes")
+    else:
+        legend_pairs = dict.fromkeys(
+            (b, c) for b, c in zip(bands, band_colors, strict=True) if b
+        )
+        legend = _legend_html(list(legend_pairs), "Bands")
+    stats = _stats_html(recs, bands, modes, datetimes)
+
+    # Exports
+    if export_csv:
+        _export_csv(export_csv, recs)
+    if export_geojson:
+        _export_geojson(export_geojson, zip(lats, lons, recs, strict=True))
+
+    summary = (
+        "Saved map with "
+        f"{len(recs)} QSOs to {out_path}. "
+        f"Skipped {skipped} record(s) without coordinates."
+    )
+
+    # Large logs: skip Folium and emit the Leaflet page directly, unless a
+    # feature only the Folium renderer provides was requested.
+    if (
+        fast_threshold
+        and len(recs) >= fast_threshold
+        and not (time_slider or heatmap_by_band or heatmap_by_mode)
+    ):
+        if use_band_layers or use_mode_layers:
+            keys = [k or "OTHER" for k in (bands if use_band_layers else modes)]
+            prefix = "Band" if use_band_layers else "Mode"
+            group_of = {k: i for i, k in enumerate(dict.fromkeys(keys))}
+            groups = [f"{prefix}: {k}" for k in group_of]
+            group_idx = [group_of[k] for k in keys]
+        else:
+            groups = ["QSOs"]
+            group_idx = [0] * len(recs)
+        color_of = {c: i for i, c in enumerate(dict.fromkeys(colors))}
+
+        b_lats = [*lats, home_latlon[0]] if home_latlon else lats
+        b_lons = [*lons, home_latlon[1]] if home_latlon else lons
+        bounds = [(min(b_lats), min(b_lons)), (max(b_lats), max(b_lons))]
+
+        save_leaflet_html(
+            out_path,
+            title=title,
+            center=center,
+            bounds=bounds,
+            lats=lats,
+            lons=lons,
+            color_idx=[color_of[c] for c in colors],
+            group_idx=group_idx,
+            popups=popups,
+            tooltips=tooltips,
+            colors=list(color_of),
+            groups=groups,
+            cluster=cluster,
+            heatmap=heatmap,
+            connect=connect,
+            home_latlon=home_latlon,
+            overlays_html="\n".join((_title_html(title), legend, stats)),
+        )
+        print(summary)
+        return
 
     fmap = folium.Map(
         location=center, zoom_start=2, control_scale=True, prefer_canvas=True
@@ -346,118 +631,77 @@ def build_map(
         attr="© OpenStreetMap contributors",
     ).add_to(fmap)
 
-    fmap.get_root().html.add_child(_title_element(title))
-
-    # Decide grouping mode
-    use_band_layers = bool(layers_by_band)
-    use_mode_layers = bool(layers_by_mode and not layers_by_band)
+    fmap.get_root().html.add_child(folium.Element(_title_html(title)))
 
     band_groups: dict[str, folium.FeatureGroup] = {}
     mode_groups: dict[str, folium.FeatureGroup] = {}
 
     if use_band_layers:
-        for _, _, rec in points:
-            band = (rec.get("BAND") or "").strip().upper() or "OTHER"
+        for band in bands:
+            band = band or "OTHER"
             if band not in band_groups:
                 grp = folium.FeatureGroup(name=f"Band: {band}")
                 grp.add_to(fmap)
                 band_groups[band] = grp
 
     if use_mode_layers:
-        for _, _, rec in points:
-            mode = (rec.get("MODE") or "").strip().upper() or "OTHER"
+        for mode in modes:
+            mode = mode or "OTHER"
             if mode not in mode_groups:
                 grp = folium.FeatureGroup(name=f"Mode: {mode}")
                 grp.add_to(fmap)
                 mode_groups[mode] = grp
 
-    # Base cluster if no layers
-    base_cluster: MarkerCluster | None = None
-    base_group: folium.FeatureGroup | None = None
-    if not use_band_layers and not use_mode_layers:
-        if cluster:
-            base_cluster = MarkerCluster(name="QSOs")
-            fmap.add_child(base_cluster)
+    # Layer each QSO belongs to (None: no layers), resolved once so the plot
+    # code does no per-marker branching.
+    layer_of: dict[str, folium.FeatureGroup] | None = None
+    layer_keys = bands
+    if use_band_layers:
+        layer_of = band_groups
+    elif use_mode_layers:
+        layer_of, layer_keys = mode_groups, modes
+
+    if cluster:
+        # Clustered markers are built in the browser from plain
+        # [lat, lon, color, popup, tooltip] rows, one FastMarkerCluster per
+        # layer, instead of a Marker/Popup/Icon object per QSO.
+        rows = [
+            list(row) for row in zip(lats, lons, colors, popups, tooltips, strict=True)
+        ]
+        if layer_of is None:
+            FastMarkerCluster(rows, callback=_MARKER_JS, name="QSOs").add_to(fmap)
         else:
-            base_group = folium.FeatureGroup(name="QSOs")
-            base_group.add_to(fmap)
-
-    by_band_colors: list[tuple[str, str]] = []
-    by_mode_colors: list[tuple[str, str]] = []
-
-    # Collect heatmap points
-    heat_data_all: list[tuple[float, float]] = []
-    heat_by_band: dict[str, list[tuple[float, float]]] = {}
-    heat_by_mode: dict[str, list[tuple[float, float]]] = {}
-
-    # Plot points
-    for lat, lon, rec in points:
-        band = (rec.get("BAND") or "").strip().upper()
-        mode = (rec.get("MODE") or "").strip().upper()
-
-        # Determine color
-        color_band = BAND_COLORS.get(band, DEFAULT_COLOR)
-        color_mode = MODE_COLORS.get(mode, DEFAULT_COLOR)
-
-        # If using band layers, color by mode for extra info; else color by band
-        color = color_mode if use_band_layers else color_band
-        if use_mode_layers:
-            color = color_mode
-
-        if band:
-            pair = (band, color_band)
-            if pair not in by_band_colors:
-                by_band_colors.append(pair)
-        if mode:
-            pair = (mode, color_mode)
-            if pair not in by_mode_colors:
-                by_mode_colors.append(pair)
-
-        popup = folium.Popup(format_popup(rec), max_width=350)
-        tooltip = rec.get("CALL", "QSO")
-
-        # Choose parent layer
-        parent = None
-        if use_band_layers:
-            parent = band_groups.get(band or "OTHER")
-        elif use_mode_layers:
-            parent = mode_groups.get(mode or "OTHER")
-
-        marker = folium.Marker(
-            location=(lat, lon),
-            popup=popup,
-            tooltip=tooltip,
-            icon=folium.Icon(color=color, icon="signal"),
-        )
-
-        if parent is not None:
-            if cluster:
-                # cluster within each layer
-                # (create one cluster per layer lazily)
-                if not hasattr(parent, "_cluster"):
-                    parent._cluster = MarkerCluster(
-                        name=f"Cluster: {parent.layer_name}"
-                    )
-                    parent._cluster.add_to(parent)  # type: ignore[attr-defined]
-                marker.add_to(parent._cluster)  # type: ignore[attr-defined]
-            else:
-                marker.add_to(parent)
+            for key, idx in _indices_by(layer_keys).items():
+                grp = layer_of[key]
+                FastMarkerCluster(
+                    [rows[i] for i in idx],
+                    callback=_MARKER_JS,
+                    name=f"Cluster: {grp.layer_name}",
+                ).add_to(grp)
+    else:
+        parents: list[folium.FeatureGroup]
+        if layer_of is None:
+            base = folium.FeatureGroup(name="QSOs")
+            base.add_to(fmap)
+            parents = [base] * len(recs)
         else:
-            if base_cluster is not None:
-                marker.add_to(base_cluster)
-            elif base_group is not None:
-                marker.add_to(base_group)
-
-        # Heatmap collections
-        heat_data_all.append((lat, lon))
-        heat_by_band.setdefault(band or "OTHER", []).append((lat, lon))
-        heat_by_mode.setdefault(mode or "OTHER", []).append((lat, lon))
+            parents = [layer_of[k or "OTHER"] for k in layer_keys]
+
+        # Plot points
+        for lat, lon, color, popup_html, tooltip, parent in zip(
+            lats, lons, colors, popups, tooltips, parents, strict=True
+        ):
+            marker = folium.Marker(
+                location=(lat, lon),
+                popup=folium.Popup(popup_html, max_width=350),
+                tooltip=tooltip,
+                icon=folium.Icon(color=color, icon="signal"),
+            )
+            marker.add_to(parent)
 
     # Polyline
-    if connect and len(points) >= 2:
-        folium.PolyLine([(p[0], p[1]) for p in points], weight=2, opacity=0.7).add_to(
-            fmap
-        )
+    if connect and len(coords) >= 2:
+        folium.PolyLine(coords, weight=2, opacity=0.7).add_to(fmap)
 
     # Home marker
     if home_latlon:
@@ -470,16 +714,16 @@ def build_map(
         ).add_to(fmap)
 
     # Fit bounds
-    bounds_pts = [(p[0], p[1]) for p in points]
+    bounds_pts = list(coords)
     if home_latlon:
         bounds_pts.append(home_latlon)
     if bounds_pts:
         fmap.fit_bounds(bounds_pts, padding=(25, 25))
 
     # Heatmaps
-    if heatmap and heat_data_all:
+    if heatmap and coords:
         HeatMap(
-            heat_data_all,
+            coords,
             radius=15,
             blur=25,
             min_opacity=0.2,
@@ -487,14 +731,15 @@ def build_map(
             control=True,
         ).add_to(fmap)
 
-    if heatmap_by_band and heat_by_band:
-        for b, pts in heat_by_band.items():
+    # Per-band/mode heatmaps index into the shared ``coords`` list
+    if heatmap_by_band and coords:
+        for b, idx in _indices_by(bands).items():
             layer = band_groups.get(b) if use_band_layers else None
             if layer is None:
                 layer = folium.FeatureGroup(name=f"Heatmap: {b}")
                 layer.add_to(fmap)
             HeatMap(
-                pts,
+                [coords[i] for i in idx],
                 radius=15,
                 blur=25,
                 min_opacity=0.2,
@@ -502,14 +747,14 @@ def build_map(
                 control=True,
             ).add_to(layer)
 
-    if heatmap_by_mode and heat_by_mode:
-        for m, pts in heat_by_mode.items():
+    if heatmap_by_mode and coords:
+        for m, idx in _indices_by(modes).items():
             layer = mode_groups.get(m) if use_mode_layers else None
             if layer is None:
                 layer = folium.FeatureGroup(name=f"Heatmap: {m}")
                 layer.add_to(fmap)
             HeatMap(
-                pts,
+                [coords[i] for i in idx],
                 radius=15,
                 blur=25,
                 min_opacity=0.2,
@@ -517,40 +762,23 @@ def build_map(
                 control=True,
             ).add_to(layer)
 
-    # Legends
-    if use_band_layers:
-        fmap.get_root().html.add_child(_legend_element(by_mode_colors, "Modes"))
-    elif use_mode_layers:
-        fmap.get_root().html.add_child(_legend_element(by_mode_colors, "Modes"))
-    else:
-        fmap.get_root().html.add_child(_legend_element(by_band_colors, "Bands"))
-
-    # Stats panel
-    fmap.get_root().html.add_child(_stats_panel([rec for _, _, rec in points]))
+    # Legend and stats panel
+    fmap.get_root().html.add_child(folium.Element(legend))
+    fmap.get_root().html.add_child(folium.Element(stats))
 
     # Time slider (TimestampedGeoJson)
-    if time_slider and points:
-        features = []
-        for lat, lon, rec in points:
-            d = (rec.get("QSO_DATE") or "").strip()
-            t = (rec.get("TIME_ON") or "").strip()
-            if len(d) == 8:
-                y, m, day = d[:4], d[4:6], d[6:8]
-                hh = t[:2] if len(t) >= 2 else "00"
-                mm = t[2:4] if len(t) >= 4 else "00"
-                ss = t[4:6] if len(t) >= 6 else "00"
-                stamp = f"{y}-{m}-{day}T{hh}:{mm}:{ss}Z"
-                props = {"time": stamp, "popup": format_popup(rec)}
-                features.append(
-                    {
-                        "type": "Feature",
-                        "geometry": {
-                            "type": "Point",
-                            "coordinates": [lon, lat],
-                        },
-                        "properties": props,
-                    }
-                )
+    if time_slider and recs:
+        features = [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [lon, lat]},
+                "properties": {"time": f"{stamp}Z", "popup": popup_html},
+            }
+            for lat, lon, stamp, popup_html in zip(
+                lats, lons, stamps, popups, strict=True
+            )
+            if stamp
+        ]
         if features:
             TimestampedGeoJson(
                 {"type": "FeatureCollection", "features": features},
@@ -568,50 +796,37 @@ def build_map(
     # Layer control
     folium.LayerControl(collapsed=False).add_to(fmap)
 
-    # Exports
-    if export_csv:
-        _export_csv(export_csv, [rec for _, _, rec in points])
-    if export_geojson:
-        _export_geojson(export_geojson, [(lat, lon, rec) for lat, lon, rec in points])
-
     fmap.save(out_path)
 
-    print(
-        "Saved map with "
-        f"{len(points)} QSOs to {out_path}. "
-        f"Skipped {skipped} record(s) without coordinates."
-    )
+    print(summary)
 
 
 # ------------------------------- Exports ------------------------------
 
 
-def _export_csv(path: str, entries: Iterable[dict[str, str]]) -> None:
-    keys = set()
-    rows = []
-    for e in entries:
-        keys.update(e.keys())
-        rows.append(e)
-    fieldnames = sorted(keys)
+def _export_csv(path: str, entries: Sequence[dict[str, str]]) -> None:
+    # Two passes over the caller's list: key union, then rows; no copies.
+    fieldnames = sorted(set().union(*(e.keys() for e in entries)))
     with open(path, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
-        for r in rows:
-            writer.writerow(r)
+        writer.writerows(entries)
 
 
 def _export_geojson(
     path: str, points: Iterable[tuple[float, float, dict[str, str]]]
 ) -> None:
-    feats = []
-    for lat, lon, rec in points:
-        feats.append(
-            {
+    # Stream one compact UTF-8 feature at a time.
+    with open(path, "wb") as f:
+        f.write(b'{"type":"FeatureCollection","features":[')
+        sep = b""
+        for lat, lon, rec in points:
+            feat = {
                 "type": "Feature",
                 "geometry": {"type": "Point", "coordinates": [lon, lat]},
                 "properties": rec,
             }
-        )
-    data = {"type": "FeatureCollection", "features": feats}
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False)
+            f.write(sep)
+            f.write(json_bytes(feat))
+            sep = b","
+        f.write(b"]}")
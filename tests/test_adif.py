@@ -1,4 +1,4 @@
-from adimap.adif import parse_adif
+from adimap.adif import parse_adif, read_adif
 
 
 def test_parse_simple_adif():
@@ -11,3 +11,37 @@ def test_parse_simple_adif():
     assert len(records) == 2
     assert records[0]["CALL"] == "TEST1"
     assert records[1]["CALL"] == "TEST2"
+
+
+def test_parse_adif_header_and_overstated_length():
+    content = (
+        "Header text <ADIF_VER:5>3.1.0<EOH>\n"
+        "<call:4>AB1C<band:5>20m<mode:3>CW<eor>\n"
+        "<CALL:3>X1Y"
+    )
+
+    records = parse_adif(content)
+    assert records == [
+        {"CALL": "AB1C", "BAND": "20m", "MODE": "CW"},
+        {"CALL": "X1Y"},
+    ]
+
+
+def test_read_adif_decodes_utf8(tmp_path):
+    path = tmp_path / "log.adi"
+    path.write_bytes(
+        "Header <EOH>\n<CALL:5>TEST1<NAME:4>José<EOR>\n".encode()
+        + b"<CALL:5>TE\xffST2<EOR>\n"
+    )
+
+    assert read_adif(str(path)) == [
+        {"CALL": "TEST1", "NAME": "José"},
+        {"CALL": "TEST2"},
+    ]
+
+
+def test_parse_adif_stray_lt_in_value():
+    content = "<COMMENT:6>5W<100<CALL:5>AB1CD<GRIDSQUARE:4>FN20<EOR>"
+
+    records = parse_adif(content)
+    assert records == [{"COMMENT": "5W", "CALL": "AB1CD", "GRIDSQUARE": "FN20"}]
@@ -0,0 +1,10 @@
+from adimap.dxcc import lookup_country
+
+
+def test_lookup_country_longest_prefix():
+    assert lookup_country("G1ABC") == "England"
+    assert lookup_country("GM3XYZ") == "Scotland"
+    assert lookup_country("9A1A") == "Croatia"
+    assert lookup_country("  gm3xyz ") == "Scotland"
+    assert lookup_country("QX1ABC") is None
+    assert lookup_country("") is None
@@ -0,0 +1,20 @@
+import json
+
+import pytest
+
+from adimap import jsonutil
+
+
+def test_json_bytes_parses_same_without_orjson(monkeypatch):
+    pytest.importorskip("orjson")
+    obj = {
+        "call": "José",
+        "coordinates": [1e-05, 52.52, -0.1],
+        "n": 3,
+        "ok": None,
+        "t": ("a",),
+    }
+    fast = jsonutil.json_bytes(obj)
+    monkeypatch.setattr(jsonutil, "orjson", None)
+    slow = jsonutil.json_bytes(obj)
+    assert json.loads(fast) == json.loads(slow) == json.loads(json.dumps(obj))
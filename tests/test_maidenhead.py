@@ -0,0 +1,43 @@
+import math
+
+from adimap.maidenhead import maidenhead_batch_to_latlon, maidenhead_to_latlon
+
+
+def test_maidenhead_to_latlon():
+    assert maidenhead_to_latlon("FN20") == (40.5, -75.0)
+    assert maidenhead_to_latlon("fn2") is None
+    assert maidenhead_to_latlon("") is None
+
+
+def test_batch_matches_scalar():
+    grids = [
+        "FN20",
+        "jn58td",
+        "JN58TD42",
+        "AA",
+        "RR99XX99",
+        "FN2",
+        "FN20A",
+        "FN20ab1",
+        "FN2012",
+        "FN20ABCDEF",
+        " pm95 ",
+        "",
+        None,
+        "ÄA",
+    ]
+    lat, lon = maidenhead_batch_to_latlon(grids)
+    for g, la, lo in zip(grids, lat.tolist(), lon.tolist(), strict=True):
+        expected = maidenhead_to_latlon(g)
+        if expected is None:
+            assert math.isnan(la) and math.isnan(lo), g
+        else:
+            assert (la, lo) == expected, g
+
+
+def test_batch_long_grid():
+    grids = ["FN20"] * 3 + ["FN20" + "X" * 20000, " " * 50 + "jn58td" + " " * 50]
+    lat, lon = maidenhead_batch_to_latlon(grids)
+    assert (lat[0], lon[0]) == (40.5, -75.0)
+    assert (lat[3], lon[3]) == maidenhead_to_latlon(grids[3])
+    assert (lat[4], lon[4]) == maidenhead_to_latlon("JN58TD")
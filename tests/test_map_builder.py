@@ -0,0 +1,115 @@
+import csv
+import json
+import math
+
+from adimap.map_builder import _parse_coord, _parse_coord_batch, build_map
+
+RECORDS = [
+    {"CALL": "K1ABC", "BAND": "20M", "MODE": "SSB", "GRIDSQUARE": "FN20"},
+    {"CALL": "DL1XY", "BAND": "40M", "MODE": "FT8", "LAT": "52.52N", "LON": "13.4E"},
+    {"CALL": "NOLOC"},
+]
+
+
+def test_build_map_folium(tmp_path):
+    out = tmp_path / "map.html"
+    build_map(RECORDS, str(out), fast_threshold=None)
+    html = out.read_text(encoding="utf-8")
+    assert "K1ABC" in html
+    assert "const QSOS" not in html
+
+
+def test_build_map_fast_path(tmp_path):
+    out = tmp_path / "map.html"
+    records = RECORDS + [{"CALL": "X</script>", "GRIDSQUARE": "JN58"}]
+    build_map(records, str(out), layers_by_band=True, fast_threshold=1)
+    html = out.read_text(encoding="utf-8")
+    assert "const QSOS" in html
+    assert '"Band: 20M"' in html
+    assert "X<\\/script>" in html
+
+
+def test_parse_coord_batch_matches_scalar():
+    texts = [
+        "52.52N",
+        "13.4e",
+        "33.9S",
+        "151.2w",
+        "-12.5",
+        "+12.5",
+        "-12.5S",
+        " 40.00N ",
+        "074.0W",
+        "0.1",
+        "90",
+        "90.0000001",
+        "-180",
+        "180.5E",
+        "1.2345678901234567",
+        "12345678901234567",
+        "0.000000000000000000000001",
+        "inf",
+        "-inf",
+        "nan",
+        "NaN",
+        "1e1",
+        "1_0",
+        "12 .5",
+        "12.5 N",
+        "12.5X",
+        "N",
+        ".",
+        "-",
+        "",
+        None,
+        "٣٣.٣",
+    ]
+    for is_lat in (True, False):
+        got = _parse_coord_batch(texts, is_lat).tolist()
+        for text, val in zip(texts, got, strict=True):
+            expected = _parse_coord(text, is_lat)
+            if expected is None:
+                assert math.isnan(val), text
+            else:
+                sign = math.copysign(1, expected)
+                assert (val, math.copysign(1, val)) == (expected, sign), text
+
+
+def test_build_map_exports(tmp_path):
+    csv_path = tmp_path / "qsos.csv"
+    geojson_path = tmp_path / "qsos.geojson"
+    build_map(
+        RECORDS,
+        str(tmp_path / "map.html"),
+        export_csv=str(csv_path),
+        export_geojson=str(geojson_path),
+    )
+
+    with open(geojson_path, encoding="utf-8") as f:
+        data = json.load(f)
+    assert data["type"] == "FeatureCollection"
+    features = data["features"]
+    assert len(features) == 2
+    assert features[0]["properties"] == RECORDS[0]
+    assert features[1]["geometry"] == {"type": "Point", "coordinates": [13.4, 52.52]}
+    assert features[1]["properties"]["CALL"] == "DL1XY"
+
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == sorted(set(RECORDS[0]) | set(RECORDS[1]))
+    assert len(rows) == 3
+
+
+def test_build_map_exports_no_qsos_with_home(tmp_path):
+    geojson_path = tmp_path / "qsos.geojson"
+    build_map(
+        [{"CALL": "NOLOC"}],
+        str(tmp_path / "map.html"),
+        home_latlon=(40.5, -75.0),
+        export_csv=str(tmp_path / "qsos.csv"),
+        export_geojson=str(geojson_path),
+    )
+
+    assert geojson_path.read_text(encoding="utf-8") == (
+        '{"type":"FeatureCollection","features":[]}'
+    )